@@ -15,6 +15,11 @@ from .. import audio
 
 logger = logging.getLogger(__name__)
 
+# Wire tokens for boolean tracker switches (str(True) would send "True"),
+# matching the form each command documents
+_ON_OFF = {True: "ON", False: "OFF"}
+_TRUE_FALSE = {True: "TRUE", False: "FALSE"}
+
 
 class CalibrationDisplay(pylink.EyeLinkCustomDisplay, ABC):
     """Abstract base class for EyeLink calibration displays.
@@ -51,16 +56,18 @@ class CalibrationDisplay(pylink.EyeLinkCustomDisplay, ABC):
         if self.tracker_version >= 3:
             # enable_search_limits: Enables use/display of global search limits (ON or OFF)
             # track_search_limits: Enables tracking of pupil to global search limits (ON or OFF)
-            self.tracker.send_command(f"enable_search_limits={self.settings.enable_search_limits}")
-            self.tracker.send_command(f"track_search_limits={self.settings.track_search_limits}")
+            self.tracker.send_command(f"enable_search_limits={_ON_OFF[self.settings.enable_search_limits]}")
+            self.tracker.send_command(f"track_search_limits={_ON_OFF[self.settings.track_search_limits]}")
 
-            # autothreshold_click: Auto-threshold on mouse click on setup mode image
-            # autothreshold_repeat: Allows repeat of auto-threshold if pupil not centered on first
-            self.tracker.send_command(f"autothreshold_click={self.settings.autothreshold_click}")
-            self.tracker.send_command(f"autothreshold_repeat={self.settings.autothreshold_repeat}")
+            # autothreshold_click: Auto-threshold on mouse click on setup mode image (TRUE or FALSE)
+            # autothreshold_repeat: Allows repeat of auto-threshold if pupil not centered on first (TRUE or FALSE)
+            self.tracker.send_command(f"autothreshold_click={_TRUE_FALSE[self.settings.autothreshold_click]}")
+            self.tracker.send_command(f"autothreshold_repeat={_TRUE_FALSE[self.settings.autothreshold_repeat]}")
 
             # enable_camera_position_detect: Allows camera position detect on click/auto-threshold in setup mode (TRUE or FALSE)
-            self.tracker.send_command(f"enable_camera_position_detect={self.settings.enable_camera_position_detect}")
+            self.tracker.send_command(
+                f"enable_camera_position_detect={_TRUE_FALSE[self.settings.enable_camera_position_detect]}"
+            )
 
     @abstractmethod
     def setup_cal_display(self) -> None:
@@ -8,6 +8,8 @@ EyeLink tracker interface.
 from __future__ import annotations
 
 import contextlib
+import functools
+import importlib
 import logging
 import os
 import signal
@@ -25,6 +27,7 @@ from .settings import Settings
 
 if TYPE_CHECKING:
     import types
+    from collections.abc import Callable, Iterable
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,63 @@ if not logger.handlers:
     logger.addHandler(console_handler)
     logger.setLevel(logging.INFO)
 
+# Priority passed to pylink.beginRealTimeMode() while recording raw data
+_RT_MODE_PRIORITY = 100
+
+# Sample data types sent by _setup_raw_data_recording(), with or without raw PCR data
+# (HMARKER/HTARGET carry the raw PCR fields)
+_RAW_SAMPLE_DATA = "LEFT,RIGHT,GAZE,GAZERES,AREA,HREF,PUPIL,STATUS,INPUT,HMARKER,HTARGET"
+_RAW_SAMPLE_DATA_COMMANDS = ("file_sample_data = " + _RAW_SAMPLE_DATA, "link_sample_data = " + _RAW_SAMPLE_DATA)
+
+# Commands sent by _setup_raw_data_recording(enable=True), keyed by enable_dual_corneal_tracking
+# file_sample_raw_pcr: Enables raw PCR mode for file output, which outputs only
+# unmodified full-resolution pupil and CR data. Data encoded using RAW (px,py,pa),
+# HREF (hx,hy), and gaze(gx,gy,rx,ry) fields. Requires PUPIL, AREA, GAZE, GAZERES,
+# HREF data types enabled. Default: OFF
+# link_sample_raw_pcr: Enables raw PCR mode for link output (same encoding as file).
+# Outputs unmodified full-resolution pupil and CR data over the link. Default: OFF
+# raw_pcr_dual_corneal: Enables detection of 2 corneal reflections in raw_pcr mode
+# These CR's are the 2 candidates closest to the pupil center. Data encoded using
+# HMARKER with htype code = 0xC0 + (word count). Default: OFF
+# Enable dual corneal tracking only if requested (can add noise during calibration):
+# 1 tracks two CR (corneal reflections), 0 tracks only the primary CR
+_RAW_PCR_ENABLE_COMMANDS = {
+    dual_corneal: (
+        "file_sample_raw_pcr = 0",  # Don't write raw data to file...
+        "link_sample_raw_pcr = 1",  # only over link
+        f"raw_pcr_dual_corneal = {int(dual_corneal)}",
+        "inputword_is_window = ON",
+        *_RAW_SAMPLE_DATA_COMMANDS,
+    )
+    for dual_corneal in (False, True)
+}
+
+# Commands sent by _setup_raw_data_recording(enable=False)
+_RAW_PCR_DISABLE_COMMANDS = (
+    "file_sample_raw_pcr = 0",
+    "link_sample_raw_pcr = 0",
+    "raw_pcr_dual_corneal = 0",
+    *_RAW_SAMPLE_DATA_COMMANDS,
+)
+
+# Display backends: name -> (module in pyelink.display, class name), imported lazily
+_DISPLAY_BACKENDS = {
+    "pygame": ("pygame_display", "PygameDisplay"),
+    "psychopy": ("psychopy_display", "PsychopyDisplay"),
+    "pyglet": ("pyglet_display", "PygletDisplay"),
+}
+
+# Display classes already imported by EyeLink._create_display()
+_display_cache: dict[str, type] = {}
+
+# Modes accepted by EyeLink.calibrate()
+_CALIBRATION_MODES = frozenset({"normal", "calibration-only", "validation-only"})
+
+# Key names (as reported by the display backends) that end run_trial early
+_ESCAPE_KEYS = frozenset({"escape", "esc"})
+
+_NOT_CONNECTED_MESSAGE = "Tracker not connected. Call connect() first or use auto_connect=True in __init__"
+
 
 class _MinimalAlertHandler(pylink.EyeLinkCustomDisplay):
     """Minimal alert handler for EyeLink connection phase.
@@ -58,6 +118,20 @@ class _MinimalAlertHandler(pylink.EyeLinkCustomDisplay):
         logger.warning("EyeLink alert: %s", msg)
 
 
+@functools.cache
+def _get_alert_handler() -> _MinimalAlertHandler:
+    """Get the shared alert handler used during tracker connection.
+
+    The handler is stateless, so one instance serves every EyeLink. It is
+    created on first use rather than at import time.
+
+    Returns:
+        The module-wide _MinimalAlertHandler instance
+
+    """
+    return _MinimalAlertHandler()
+
+
 def _cleanup_on_exit() -> None:
     """Clean up graphics on exit.
 
@@ -68,6 +142,20 @@ def _cleanup_on_exit() -> None:
         pylink.closeGraphics()
 
 
+def _run_cleanup_step(description: str, step: Callable[[], object]) -> None:
+    """Run one cleanup step, logging instead of raising on failure.
+
+    Args:
+        description: Short name of the step, used in the log message
+        step: Callable performing the step
+
+    """
+    try:
+        step()
+    except Exception:
+        logger.debug("Cleanup step failed: %s", description, exc_info=True)
+
+
 class EyeLink:  # noqa: PLR0904
     """Unified EyeLink tracker interface with integrated display management.
 
@@ -149,7 +237,6 @@ class EyeLink:  # noqa: PLR0904
         self.tracker: pylink.EyeLink | None = None
         self.realconnect = False
         self.edfname = settings.filename  # Note: .edf extension added automatically by openDataFile()
-        self._alert_handler: object | None = None
 
         # Store initialization parameters for deferred setup
         self._sample_buffer_length = sample_buffer_length
@@ -160,6 +247,7 @@ class EyeLink:  # noqa: PLR0904
         # Component initialization state
         self._connected = False
         self._cleaned_up = False
+        self._cleanup_lock = threading.RLock()
         self._is_recording = False
 
         # Components (will be initialized in connect())
@@ -173,6 +261,13 @@ class EyeLink:  # noqa: PLR0904
         # User cleanup registry
         self._user_cleanups = []
 
+        # Messages waiting for flush_messages(): (pylink.currentTime() when queued, message)
+        self._queued_messages: list[tuple[int, str]] = []
+
+        # Tracker queries that are fixed for a connection (version) or a recording (eye)
+        self._tracker_version: int | None = None
+        self._eye_available: int | None = None
+
         # Connect immediately if auto_connect is True
         if auto_connect:
             self.connect()
@@ -266,49 +361,48 @@ class EyeLink:  # noqa: PLR0904
             return
 
         # Set up minimal alert handler BEFORE connecting
-        self._alert_handler = _MinimalAlertHandler()
         with contextlib.suppress(RuntimeError):
-            pylink.openGraphicsEx(self._alert_handler)
+            pylink.openGraphicsEx(_get_alert_handler())
 
         logger.info("Connecting to EyeLink...")
+        host_ip = self.settings.host_ip
 
         # Dummy mode if explicitly requested
-        if self.settings.host_ip is None or str(self.settings.host_ip).lower() == "dummy":
-            logger.info("Using EyeLink in dummy mode (settings.host_ip is None or 'dummy')")
+        if self.settings.is_dummy_mode:
+            logger.info("Using EyeLink in dummy mode (settings.host_ip is 'dummy')")
             self.tracker = pylink.EyeLink(None)
             self.realconnect = False
         else:
+            is_connected = False
             try:
-                self.tracker = pylink.EyeLink(trackeraddress=self.settings.host_ip)
+                self.tracker = pylink.EyeLink(trackeraddress=host_ip)
                 # Check if connection actually succeeded
-                if self.tracker is not None:
-                    try:
-                        is_connected = self.tracker.isConnected()
-                    except Exception:
-                        is_connected = False
-                else:
-                    is_connected = False
+                with contextlib.suppress(Exception):
+                    is_connected = self.tracker is not None and self.tracker.isConnected()
             except RuntimeError:
-                # User-facing troubleshooting messages - not exception logging
-                logger.error("ERROR: Could not connect to EyeLink tracker!")  # noqa: TRY400
-                logger.error("Current Host PC IP setting: %s", self.settings.host_ip)  # noqa: TRY400
-                logger.error("Please check:")  # noqa: TRY400
-                logger.error("  1. EyeLink Host PC is powered on")  # noqa: TRY400
-                logger.error("  2. Ethernet cable is connected")  # noqa: TRY400
-                logger.error("  3. Host PC IP address matches settings.host_ip")  # noqa: TRY400
-                logger.error("  4. Your computer's IP is on the same subnet (e.g., 100.1.1.2)")  # noqa: TRY400
-                logger.error("Cleaning up and exiting...")  # noqa: TRY400
+                # User-facing troubleshooting message - not exception logging
+                logger.error(  # noqa: TRY400
+                    "ERROR: Could not connect to EyeLink tracker!\n"
+                    "Current Host PC IP setting: %s\n"
+                    "Please check:\n"
+                    "  1. EyeLink Host PC is powered on\n"
+                    "  2. Ethernet cable is connected\n"
+                    "  3. Host PC IP address matches settings.host_ip\n"
+                    "  4. Your computer's IP is on the same subnet (e.g., 100.1.1.2)\n"
+                    "Cleaning up and exiting...",
+                    host_ip,
+                )
                 self._exit_with_cleanup(1)
             except Exception:
                 logger.exception("Unexpected error while connecting to EyeLink")
                 logger.error("Cleaning up and exiting...")  # noqa: TRY400
                 self._exit_with_cleanup(1)
 
-            if self.tracker is not None and is_connected:
+            if is_connected:
                 self.realconnect = True
-                logger.info("Successfully connected to EyeLink at %s", self.settings.host_ip)
+                logger.info("Successfully connected to EyeLink at %s", host_ip)
             else:
-                logger.error("Failed to connect to EyeLink at %s (unknown error)", self.settings.host_ip)
+                logger.error("Failed to connect to EyeLink at %s (unknown error)", host_ip)
                 self._exit_with_cleanup(1)
 
         # Close the minimal alert handler graphics
@@ -320,9 +414,10 @@ class EyeLink:  # noqa: PLR0904
             with contextlib.suppress(Exception):
                 self.tracker.stopRecording()
 
-        # Flush keyboard queue and set tracker to offline mode
+        # Flush keyboard queue and set tracker to offline mode (unless it already is)
         pylink.flushGetkeyQueue()
-        self.tracker.setOfflineMode()
+        if not self._in_idle_mode():
+            self.tracker.setOfflineMode()
 
         # Enable long filenames on Host PC if requested
         if self.settings.enable_long_filenames and self.realconnect:
@@ -372,7 +467,7 @@ class EyeLink:  # noqa: PLR0904
 
         """
         if self.tracker is None:
-            raise RuntimeError("Tracker not connected. Call connect() first or use auto_connect=True in __init__")
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
 
     def disconnect(self) -> None:
         """Close the connection to the tracker."""
@@ -380,6 +475,8 @@ class EyeLink:  # noqa: PLR0904
             with contextlib.suppress(Exception):
                 self.tracker.close()
             self.tracker = None
+        self._tracker_version = None
+        self._eye_available = None
 
     def is_connected(self) -> bool:
         """Check if connected to tracker.
@@ -426,22 +523,18 @@ class EyeLink:  # noqa: PLR0904
             ValueError: If backend name invalid
 
         """
-        if backend_name == "pygame":
-            from .display.pygame_display import PygameDisplay  # noqa: PLC0415
-
-            return PygameDisplay(self.settings, shutdown_handler=self._signal_handler)
-        if backend_name == "psychopy":
-            from .display.psychopy_display import PsychopyDisplay  # noqa: PLC0415
-
-            return PsychopyDisplay(self.settings, shutdown_handler=self._signal_handler)
-        if backend_name == "pyglet":
-            from .display.pyglet_display import PygletDisplay  # noqa: PLC0415
-
-            return PygletDisplay(self.settings, shutdown_handler=self._signal_handler)
-        raise ValueError(
-            f"Invalid backend: {backend_name}. Must be 'pygame', 'psychopy', or 'pyglet'. "
-            f"Install with: uv pip install -e '.[{backend_name}]'"
-        )
+        display_class = _display_cache.get(backend_name)
+        if display_class is None:
+            if backend_name not in _DISPLAY_BACKENDS:
+                raise ValueError(
+                    f"Invalid backend: {backend_name}. Must be 'pygame', 'psychopy', or 'pyglet'. "
+                    f"Install with: uv pip install -e '.[{backend_name}]'"
+                )
+            module_name, class_name = _DISPLAY_BACKENDS[backend_name]
+            module = importlib.import_module(f".display.{module_name}", __package__)
+            display_class = _display_cache[backend_name] = getattr(module, class_name)
+
+        return display_class(self.settings, shutdown_handler=self._signal_handler)
 
     @property
     def window(self) -> object:
@@ -574,6 +667,7 @@ class EyeLink:  # noqa: PLR0904
         duration: float | None = None,
         record: bool = True,
         on_ui_event: object | None = None,
+        frame_rate: float | None = None,
     ) -> dict:
         """Run a trial with automatic recording and event handling (Option B helper).
 
@@ -589,6 +683,9 @@ class EyeLink:  # noqa: PLR0904
             on_ui_event: Optional callback for UI events. Called as `on_ui_event(event_dict, trial_data)`.
                         UI events = keyboard/mouse, NOT eye-tracking events.
                         Return True to end trial early.
+            frame_rate: Optional loop rate in Hz. When set, each iteration sleeps until the
+                        next frame deadline instead of yielding for 1 ms. Use it when the
+                        backend's flip() does not block on vertical sync.
 
         Returns:
             dict with keys:
@@ -597,6 +694,10 @@ class EyeLink:  # noqa: PLR0904
             - 'ui_events': List of UI event dicts that occurred
             - 'ended_by': 'duration', 'callback', or 'escape'
 
+        Raises:
+            ValueError: If frame_rate is not positive
+            RuntimeError: If the display has not been created
+
         Example::
 
             def draw_stimulus(window, data):
@@ -619,32 +720,42 @@ class EyeLink:  # noqa: PLR0904
             )
 
         """
+        if frame_rate is not None and frame_rate <= 0:
+            raise ValueError(f"Invalid frame_rate: {frame_rate}. Must be a positive number of Hz")
         if self.display is None:
             raise RuntimeError("Display not created. Call connect() first")
 
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = None if duration is None else start_time + duration
         ui_events = []
         ended_by = "duration"
+        frame_interval = None if frame_rate is None else 1.0 / frame_rate
+        next_frame = start_time
 
         if trial_data is None:
             trial_data = {}
 
+        # Bind per-frame lookups once; the display does not change during a trial
+        window = self.display.window
+        flip = self.display.flip
+        get_events = self.display.get_events
+        record_event = ui_events.append
+
         if record:
             self.start_recording()
 
         try:
             while True:
                 # Draw
-                draw_func(self.window, trial_data)
-                self.flip()
+                draw_func(window, trial_data)
+                flip()
 
                 # Handle UI events (keyboard/mouse)
-                events = self.display.get_events()
-                for event in events:
-                    ui_events.append(event)
+                for event in get_events():
+                    record_event(event)
 
                     # Check for escape key
-                    if event.get("type") == "keydown" and event.get("key") in {"escape", "esc"}:
+                    if event.get("type") == "keydown" and event.get("key") in _ESCAPE_KEYS:
                         ended_by = "escape"
                         break
 
@@ -659,17 +770,31 @@ class EyeLink:  # noqa: PLR0904
                     break
 
                 # Check duration
-                if duration is not None and (time.time() - start_time) >= duration:
+                if deadline is not None and time.monotonic() >= deadline:
                     break
 
-                time.sleep(0.001)
+                if frame_interval is None:
+                    time.sleep(0.001)
+                else:
+                    next_frame += frame_interval
+                    delay = next_frame - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        # Fell behind (slow draw); resynchronize instead of bursting to catch up
+                        next_frame = time.monotonic()
 
         finally:
+            # A failed flush must neither skip stop_recording() nor mask the trial's exception
+            try:
+                self.flush_messages()
+            except Exception:
+                logger.exception("Failed to flush queued messages")
             if record:
                 self.stop_recording()
 
         return {
-            "duration": time.time() - start_time,
+            "duration": time.monotonic() - start_time,
             "ui_events": ui_events,
             "ended_by": ended_by,
         }
@@ -704,6 +829,16 @@ class EyeLink:  # noqa: PLR0904
         self._ensure_connected()
         self.tracker.sendCommand(command)
 
+    def _send_config_commands(self, commands: Iterable[str]) -> None:
+        """Send configuration commands in order, one send_command() call each.
+
+        Args:
+            commands: EyeLink command strings, in the order they should be applied
+
+        """
+        for command in commands:
+            self.send_command(command)
+
     def send_message(self, message: str) -> None:
         """Send a timestamped message recorded in the EDF data file.
 
@@ -721,8 +856,57 @@ class EyeLink:  # noqa: PLR0904
             tracker.send_message(f"RESPONSE key={response} rt={rt:.3f}")
 
         """
-        self._ensure_connected()
-        self.tracker.sendMessage(message)
+        tracker = self.tracker
+        if tracker is None:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
+        tracker.sendMessage(message)
+
+    def queue_message(self, message: str) -> None:
+        """Queue a message to be written to the EDF file later, keeping its timestamp.
+
+        Use this instead of :meth:`send_message` on timing-critical paths (e.g. right
+        after a stimulus flip) to avoid a round-trip to the Host PC at that moment.
+        The local time (``pylink.currentTime()``) is captured now; when the queue is
+        flushed, each message is sent with the standard EyeLink time-offset prefix
+        (``"<ms> message"``, the time elapsed since queueing), so Data Viewer places
+        it at the time it was queued.
+
+        Queued messages are flushed automatically at the end of :meth:`run_trial`.
+        Call :meth:`flush_messages` yourself when not using ``run_trial``.
+
+        Args:
+            message: Message string to record in EDF file
+
+        Example::
+
+            tracker.flip()
+            tracker.queue_message("STIMULUS_ONSET image.png")
+            ...
+            tracker.flush_messages()
+
+        """
+        self._queued_messages.append((pylink.currentTime(), message))
+
+    def flush_messages(self) -> None:
+        """Send all queued messages to the tracker with their time offsets.
+
+        Messages are sent in the order they were queued. Does nothing if the
+        queue is empty.
+
+        Raises:
+            RuntimeError: If messages are queued but the tracker is not connected
+
+        """
+        if not self._queued_messages:
+            return
+        tracker = self.tracker
+        if tracker is None:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
+        # Take the queue first so a failed send cannot resend earlier messages later
+        messages, self._queued_messages = self._queued_messages, []
+        for queued_at, message in messages:
+            # Offset from the time of this send, so earlier sends do not shift it
+            tracker.sendMessage(f"{pylink.currentTime() - queued_at} {message}")
 
     def get_tracker_version(self) -> int:
         """Get the tracker version as an integer.
@@ -730,18 +914,64 @@ class EyeLink:  # noqa: PLR0904
         Returns:
             Tracker version as int, or 0 if not connected or parsing fails
 
+        Note:
+            The version is queried once per connection and cached.
+
         """
+        if self._tracker_version is not None:
+            return self._tracker_version
         self._ensure_connected()
         try:
-            return int(self.tracker.getTrackerVersion())
+            self._tracker_version = int(self.tracker.getTrackerVersion())
         except Exception:
             return 0
+        return self._tracker_version
 
     def set_offline_mode(self) -> None:
         """Set tracker to offline mode."""
         self._ensure_connected()
         self.tracker.setOfflineMode()
 
+    def _in_idle_mode(self) -> bool:
+        """Check whether the tracker is already in idle (offline) mode.
+
+        Returns:
+            True if the tracker reports idle mode or runs in dummy mode, False otherwise
+
+        """
+        self._ensure_connected()
+        if not self.realconnect:
+            return True
+        return bool(self.tracker.getCurrentMode() & pylink.IN_IDLE_MODE)
+
+    def _wait_for_mode(self, mode: int, timeout: float) -> bool:
+        """Wait until the tracker reports the given mode, or until timeout.
+
+        Polls the tracker mode so callers only wait as long as the mode
+        transition actually takes. The timeout bounds the worst case, so a
+        transition that is never reported costs the same as the fixed sleep
+        this replaces.
+
+        Args:
+            mode: pylink mode flag to wait for (e.g. pylink.IN_IDLE_MODE)
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the mode was reached (always True in dummy mode), False on timeout.
+            Callers where a timeout only costs the old fixed delay may ignore it.
+
+        """
+        if not self.realconnect:
+            return True
+
+        deadline = time.monotonic() + timeout
+        while not (self.tracker.getCurrentMode() & mode):
+            if time.monotonic() >= deadline:
+                logger.debug("Tracker did not report mode 0x%x within %.3f s", mode, timeout)
+                return False
+            time.sleep(0.002)
+        return True
+
     def stop_recording(self) -> None:
         """Stop recording."""
         if self.record_raw_data:
@@ -761,6 +991,7 @@ class EyeLink:  # noqa: PLR0904
         self._ensure_connected()
         self.tracker.stopRecording()
         self._is_recording = False
+        self._eye_available = None
         logger.info("Recording stopped")
 
     def eye_available(self) -> int:
@@ -769,9 +1000,18 @@ class EyeLink:  # noqa: PLR0904
         Returns:
             0=left, 1=right, 2=binocular, -1 if not available
 
+        Note:
+            A valid eye is cached until recording starts or stops, since the data
+            buffers query it for every sample. -1 is never cached.
+
         """
+        if self._eye_available is not None:
+            return self._eye_available
         self._ensure_connected()
-        return self.tracker.eyeAvailable()
+        eye = self.tracker.eyeAvailable()
+        if eye >= 0:
+            self._eye_available = eye
+        return eye
 
     def get_newest_sample(self) -> object | None:
         """Get the newest sample from the tracker.
@@ -780,8 +1020,10 @@ class EyeLink:  # noqa: PLR0904
             Sample object or None
 
         """
-        self._ensure_connected()
-        return self.tracker.getNewestSample()
+        tracker = self.tracker
+        if tracker is None:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
+        return tracker.getNewestSample()
 
     def get_next_data(self) -> int:
         """Get next data type from the tracker buffer.
@@ -790,8 +1032,10 @@ class EyeLink:  # noqa: PLR0904
             Data type code (200=sample, 4=blink, 8=fixation, 0x3F/0=no data)
 
         """
-        self._ensure_connected()
-        return self.tracker.getNextData()
+        tracker = self.tracker
+        if tracker is None:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
+        return tracker.getNextData()
 
     def get_float_data(self) -> object | None:
         """Get float data from tracker buffer.
@@ -800,8 +1044,10 @@ class EyeLink:  # noqa: PLR0904
             Data object or None
 
         """
-        self._ensure_connected()
-        return self.tracker.getFloatData()
+        tracker = self.tracker
+        if tracker is None:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
+        return tracker.getFloatData()
 
     def set_calibration_type(self, cal_type: str) -> None:
         """Set calibration type (equation to use as a fit).
@@ -875,9 +1121,8 @@ class EyeLink:  # noqa: PLR0904
 
         """
         # Validate mode parameter
-        valid_modes = {"normal", "calibration-only", "validation-only"}
-        if mode not in valid_modes:
-            raise ValueError(f"Invalid mode: {mode}. Must be one of: {', '.join(sorted(valid_modes))}")
+        if mode not in _CALIBRATION_MODES:
+            raise ValueError(f"Invalid mode: {mode}. Must be one of: {', '.join(sorted(_CALIBRATION_MODES))}")
 
         # Create calibration display using internal window
         calibration_display = create_calibration(self.settings, self, mode=mode)
@@ -922,20 +1167,24 @@ class EyeLink:  # noqa: PLR0904
             # Stop sending samples
             if record_samples:
                 self.send_command("sticky_mode_data_enable")
-                self.send_command("set_idle_mode")
-                time.sleep(0.1)  # Wait to finish mode transition
 
                 # sticky_mode_data_enable is only switched off when there is an actual
-                # mode change. The above set_idle_mode is a no-op as the tracker is
-                # already offline at that point. If sticky mode is not switched off
-                # properly, we end up with junk samples in a small bit of the edf file,
-                # overwriting part of the next trial
+                # mode change. The tracker is already offline at this point, so a plain
+                # set_idle_mode would be a no-op; go through the setup menu and back to
+                # force the change. If sticky mode is not switched off properly, we end
+                # up with junk samples in a small bit of the edf file, overwriting part
+                # of the next trial
                 # setup_menu_mode: Calls up Setup menu in EyeLink 1, Camera Setup menu in EyeLink II/CL
                 # No data output is available in this mode
                 self.send_command("setup_menu_mode")
-                time.sleep(0.1)  # Wait to finish mode transition
+                if not self._wait_for_mode(pylink.IN_SETUP_MODE, timeout=0.1):
+                    logger.warning(
+                        "Tracker did not enter setup mode after calibration; "
+                        "sticky sample data may not be switched off"
+                    )
                 self.send_command("set_idle_mode")
-                time.sleep(0.1)  # Wait to finish mode transition
+                if not self._wait_for_mode(pylink.IN_IDLE_MODE, timeout=0.1):
+                    logger.warning("Tracker did not return to idle mode after calibration")
         else:
             # Dummy mode - show dummy calibration
             calibration_display.dummynote()
@@ -986,7 +1235,7 @@ class EyeLink:  # noqa: PLR0904
         self.settings.calibration_instruction_text = original_instruction_text
 
     def start_recording(self, sendlink: bool = False) -> None:
-        """Start recording. Waits 50ms to allow EyeLink to prepare.
+        """Start recording once the tracker reports idle mode (waiting at most 50 ms).
 
         Args:
             sendlink: Toggle for sending eye data over the link to display computer during recording
@@ -1032,7 +1281,7 @@ class EyeLink:  # noqa: PLR0904
 
         # set_idle_mode: Enters Offline mode before starting recording
         self.send_command("set_idle_mode")
-        time.sleep(0.05)
+        self._wait_for_mode(pylink.IN_IDLE_MODE, timeout=0.05)
 
         if record_raw_data:
             sendlink = True  # <--- This is KEY!
@@ -1046,6 +1295,7 @@ class EyeLink:  # noqa: PLR0904
             self.tracker.startRecording(1, 1, 0, 0)
 
         self._is_recording = True
+        self._eye_available = None
         logger.info("Recording started")
 
     def end_experiment(self) -> None:
@@ -1063,10 +1313,15 @@ class EyeLink:  # noqa: PLR0904
         otherwise file transfer can be very slow.
 
         """
-        # Prevent duplicate cleanup
-        if self._cleaned_up:
-            return
-        self._cleaned_up = True
+        # Prevent duplicate cleanup. The lock makes the check-and-set atomic when a
+        # display backend's Ctrl+C callback races the main thread; it is re-entrant
+        # so a SIGINT arriving during cleanup on the main thread returns here. The
+        # signal handler then exits the process, so it must not be able to run while
+        # the EDF file is still being received (see the transfer step below)
+        with self._cleanup_lock:
+            if self._cleaned_up:
+                return
+            self._cleaned_up = True
 
         # Only cleanup if we were connected
         if not self._connected or self.tracker is None:
@@ -1081,37 +1336,37 @@ class EyeLink:  # noqa: PLR0904
             except Exception as e:  # noqa: PERF203
                 logger.warning("User cleanup failed: %s", e)
 
-        # Stop recording if active
-        with contextlib.suppress(Exception):
-            self.stop_recording()
+        # Each step runs even if an earlier one failed, so the EDF transfer
+        # (most important - always try to save data) is never skipped
+        _run_cleanup_step("flush queued messages", self.flush_messages)
+        _run_cleanup_step("stop recording", self.stop_recording)
 
-        # Shutdown data and events buffers
-        with contextlib.suppress(Exception):
-            if self.data is not None:
-                self.data.shutdown()
-        with contextlib.suppress(Exception):
-            if self.events is not None:
-                self.events.shutdown()
-
-        # Close display window
-        with contextlib.suppress(Exception):
-            if self.display is not None:
-                self.display.close()
-                logger.info("Display window closed")
+        self._shutdown_buffers()
+        if self.display is not None:
+            _run_cleanup_step("close display window", self._close_display)
 
-        # Transfer EDF file (most important - always try to save data)
-        with contextlib.suppress(Exception):
-            self._transfer_data_file(self._data_save_path)
-
-        # Disconnect from tracker
-        with contextlib.suppress(Exception):
-            self.disconnect()
+        # Transfer EDF file on the main thread: receiveDataFile() is a blocking C call,
+        # so a repeated Ctrl+C is only handled (and the process exits) once the file is saved
+        _run_cleanup_step("transfer EDF file", functools.partial(self._transfer_data_file, self._data_save_path))
+        _run_cleanup_step("disconnect", self.disconnect)
 
         self.tracker = None
         self._connected = False
 
         logger.info("Experiment cleanup complete")
 
+    def _shutdown_buffers(self) -> None:
+        """Stop the data and event reader threads (cleanup step of end_experiment)."""
+        if self.data is not None:
+            _run_cleanup_step("shut down data buffer", self.data.shutdown)
+        if self.events is not None:
+            _run_cleanup_step("shut down event processor", self.events.shutdown)
+
+    def _close_display(self) -> None:
+        """Close the display window (cleanup step of end_experiment)."""
+        self.display.close()
+        logger.info("Display window closed")
+
     # Recording management methods (from recorder.py)
 
     def _check_output_file_conflict(self) -> None:
@@ -1278,7 +1533,7 @@ class EyeLink:  # noqa: PLR0904
 
         # Set tracker to offline mode
         self.set_offline_mode()
-        time.sleep(0.5)
+        self._wait_for_mode(pylink.IN_IDLE_MODE, timeout=0.5)
 
         # Close the file
         self._close_data_file()
@@ -1338,73 +1593,46 @@ class EyeLink:  # noqa: PLR0904
 
     # Configuration methods (from config.py)
 
-    def _build_screen_phys_coords_command(self, use_equals: bool = False) -> str:
-        """Build screen physical coordinates command string.
-
-        Args:
-            use_equals: If True, include '=' in command format
+    def _screen_phys_coords(self) -> str:
+        """Build the screen physical coordinates argument string.
 
         Returns:
-            Command string with screen physical coordinates in mm
-            Format: "screen_phys_coords [=] left top right bottom"
+            Screen edges relative to the display center in mm
+            Format: "left top right bottom"
 
         Note:
             SCREEN_WIDTH and SCREEN_HEIGHT are already in mm
 
         """
-        left = -self.settings.screen_width / 2.0
-        top = self.settings.screen_height / 2.0
-        right = self.settings.screen_width / 2.0
-        bottom = -self.settings.screen_height / 2.0
-        separator = " = " if use_equals else " "
-        return f"screen_phys_coords{separator}{left} {top} {right} {bottom}"
+        half_width = self.settings.screen_width / 2.0
+        half_height = self.settings.screen_height / 2.0
+        return f"{-half_width} {half_height} {half_width} {-half_height}"
 
-    def _select_eye(self, eye_tracked: str = "both") -> None:
-        """Select eye to track.
-
-        Configures the tracker for monocular or binocular tracking by sending:
-        - binocular_enabled: Sets whether tracking is binocular or monocular
-        - active_eye: Sets which eye to track in monocular mode (LEFT or RIGHT)
+    def _geometry_commands(self) -> tuple[str, ...]:
+        """Build the screen and camera geometry commands for the current settings.
 
-        Args:
-            eye_tracked: 'both' for binocular, 'left' or 'right' for monocular
-
-        """
-        if "BOTH" in eye_tracked.upper():
-            self.send_command("binocular_enabled = YES")
-        else:
-            self.send_command("binocular_enabled = NO")
-            self.send_command("active_eye = " + eye_tracked.upper())
+        Called by _set_all_constants() when connecting, so the values come from the
+        settings as they are at connect time.
 
-    def _set_all_constants(self) -> None:
-        """Override values in final.ini to ensure proper settings are used.
+        Returns:
+            Tuple of command strings, in the order they should be sent
 
-        Values are imported from Settings object.
         """
-        sres = self.settings.screen_res
-
-        # Set illumination power
-        self.send_command("elcl_tt_power " + str(self.settings.illumination_power))
-
-        # Set screen coordinate system for gaze position and calibration
-        # DISPLAY_COORDS: Message written to EDF file to record display resolution for DataViewer
+        s = self.settings
+        width, height = s.screen_res
         # screen_pixel_coords: Command that sets the gaze-position coordinate system used
         #                      for calibration targets and drawing commands
         # Parameters: <left>: X coordinate of left of display area
         #             <top>: Y coordinate of top of display area
         #             <right>: X coordinate of right of display area
         #             <bottom>: Y coordinate of bottom of display area
-        disptxt = f"DISPLAY_COORDS 0 0 {sres[0] - 1} {sres[1] - 1}"
-        self.send_message(disptxt)
-
-        scrtxt = f"screen_pixel_coords 0 0 {sres[0] - 1} {sres[1] - 1}"
-        self.send_command(scrtxt)
+        commands = [f"screen_pixel_coords 0 0 {width - 1} {height - 1}"]
 
         # screen_phys_coords: Sets the physical screen geometry for visual angle calculations
         # Measures the distance of display screen edges relative to center (in millimetres)
         # Parameters: <left>, <top>, <right>, <bottom>: position of display area corners
         #             relative to display center
-        self.send_command(self._build_screen_phys_coords_command())
+        commands.append(f"screen_phys_coords = {self._screen_phys_coords()}")
 
         # screen_distance = <mm to center> | <mm to top> <mm to bottom>
         # Used for visual angle and velocity calculations.
@@ -1412,15 +1640,15 @@ class EyeLink:  # noqa: PLR0904
         #   <mm to center>: distance from display center to subject in millimetres.
         #   <mm to top>: distance from display top to subject in millimetres.
         #   <mm to bottom>: distance from display bottom to subject in millimetres.
-        if self.settings.screen_distance_top_bottom is not None:
-            scrtxt = f"screen_distance = {self.settings.screen_distance_top_bottom[0]} {self.settings.screen_distance_top_bottom[1]}"
-            self.send_command(scrtxt)
+        if s.screen_distance_top_bottom is not None:
+            commands.append(f"screen_distance = {s.screen_distance_top_bottom[0]} {s.screen_distance_top_bottom[1]}")
         else:
-            self.send_command(f"screen_distance = {self.settings.screen_distance}")
+            commands.append(f"screen_distance = {s.screen_distance}")
+
         # Set remote mode lens if provided
-        if self.settings.camera_lens_focal_length is not None:
-            self.send_command(f"camera_lens_focal_length = {self.settings.camera_lens_focal_length}")
-        if self.settings.camera_to_screen_distance is not None:
+        if s.camera_lens_focal_length is not None:
+            commands.append(f"camera_lens_focal_length = {s.camera_lens_focal_length}")
+        if s.camera_to_screen_distance is not None:
             # remote_camera_position: Sets position and angles for remote camera mounting
             # (Desktop Remote Recording configuration)
             # Parameters: <rh>: rotation of camera from screen (clockwise from top),
@@ -1429,72 +1657,84 @@ class EyeLink:  # noqa: PLR0904
             #             <dx>: bottom-center of display in cam coords
             #             <dy>: bottom-center of display in cam coords
             #             <dz>: bottom-center of display in cam coords
-            self.send_command(f"remote_camera_position = -10 17 80 60 -{self.settings.camera_to_screen_distance}")
-
-        # Set content of edf file
-        # file_event_filter: Sets which event types to save to EDF file
-        # Event types: LEFT, RIGHT, FIXATION, FIXUPDATE, SACCADE, BLINK, MESSAGE, BUTTON, INPUT
-        self.send_command("file_event_filter = " + self.settings.file_event_filter)
-
-        # link_event_filter: Sets which event types to send over link (same types as file_event_filter)
-        self.send_command("link_event_filter = " + self.settings.link_event_filter)
-
-        # link_sample_data: Controls what sample data is transferred over the link
-        # Data types: LEFT/RIGHT, GAZE, GAZERES, AREA, HREF, PUPIL, STATUS, INPUT, HMARKER/HTARGET
-        self.send_command("link_sample_data = " + self.settings.link_sample_data)
-
-        # file_sample_data: Sets the contents of sample data in the EDF file recording
-        # Data types: LEFT/RIGHT, GAZE, GAZERES, AREA, HREF, PUPIL, STATUS, INPUT, HMARKER/HTARGET
-        self.send_command("file_sample_data = " + self.settings.file_sample_data)
-
-        self.send_command(self._build_screen_phys_coords_command(use_equals=True))
-
-        # sample_rate: Sampling rate of the eye tracker (in Hz). Can only be changed in offline
-        # and camera setup modes. Common values: 250, 500, 1000, 2000 Hz. Default: 1000 Hz
-        self.send_command(f"sample_rate = {self.settings.sample_rate}")
-
-        # pupil_size_diameter: Sets the type of data used for pupil size
-        # Types: AREA (0), DIAMETER (1, 128*sqrt(area)), WIDTH (2, 180*width), HEIGHT (3, 180*height)
-        self.send_command(f"pupil_size_diameter = {self.settings.pupil_size_mode}")
-
-        # calibration_corner_scaling / validation_corner_scaling: Scaling factor for distance
-        # of corner targets from display center. Default is 1.0, but can be 0.75 to 0.9 to
-        # pull in corners (to limit gaze excursion or to limit validation to useful part of display)
-        # NOTE: setting for calibration also sets validation
-        self.send_command(" ".join(["calibration_corner_scaling", "=", str(self.settings.calibration_corner_scaling)]))
-        self.send_command(" ".join(["validation_corner_scaling", "=", str(self.settings.validation_corner_scaling)]))
-
-        # calibration_area_proportion / validation_area_proportion: For auto generated
-        # calibration/validation point positions, sets the part of width/height of display
-        # to be bounded by targets. Each may have a single proportion or a horizontal
-        # followed by a vertical proportion. Default values: 0.88, 0.83
-        # NOTE: setting for calibration also sets validation
-        self.send_command(
-            " ".join([
-                "calibration_area_proportion",
-                "=",
-                " ".join([str(i) for i in self.settings.calibration_area_proportion]),
-            ])
-        )
-        self.send_command(
-            " ".join([
-                "validation_area_proportion",
-                "=",
-                " ".join([str(i) for i in self.settings.validation_area_proportion]),
-            ])
-        )
+            commands.append(f"remote_camera_position = -10 17 80 60 -{s.camera_to_screen_distance}")
+        return tuple(commands)
+
+    def _select_eye(self, eye_tracked: str = "both") -> None:
+        """Select eye to track.
 
-        # heuristic_filter: Sets level of filtering on link/analog output and file data
-        # <link level> <file level>: 0 or OFF (no filter), 1 or ON (moderate, 1 sample delay),
-        # 2 (extra filtering, 2 sample delay). Default file filter level is 2
-        self.send_command(f"heuristic_filter {self.settings.heuristic_filter[0]} {self.settings.heuristic_filter[1]}")
+        Configures the tracker for monocular or binocular tracking by sending:
+        - binocular_enabled: Sets whether tracking is binocular or monocular
+        - active_eye: Sets which eye to track in monocular mode (LEFT or RIGHT)
 
-        # use_ellipse_fitter: Controls pupil fitting algorithm
-        # YES for ellipse fitting, NO for centroid (CENTROID mode)
-        if "CENTROID" in self.settings.pupil_tracking_mode:
-            self.send_command("use_ellipse_fitter = NO")
+        Args:
+            eye_tracked: 'both' for binocular, 'left' or 'right' for monocular
+
+        """
+        if "BOTH" in eye_tracked.upper():
+            commands = ("binocular_enabled = YES",)
         else:
-            self.send_command("use_ellipse_fitter = YES")
+            commands = ("binocular_enabled = NO", "active_eye = " + eye_tracked.upper())
+        self._send_config_commands(commands)
+
+    def _set_all_constants(self) -> None:
+        """Override values in final.ini to ensure proper settings are used.
+
+        Values are imported from Settings object.
+        """
+        s = self.settings
+        width, height = s.screen_res
+
+        # Set screen coordinate system for gaze position and calibration
+        # DISPLAY_COORDS: Message written to EDF file to record display resolution for DataViewer
+        disptxt = f"DISPLAY_COORDS 0 0 {width - 1} {height - 1}"
+        self.send_message(disptxt)
+
+        commands = [
+            # Set illumination power
+            "elcl_tt_power " + str(s.illumination_power),
+            # Screen geometry: pixel/physical coordinates, viewing distance and camera mounting
+            *self._geometry_commands(),
+            # Set content of edf file
+            # file_event_filter: Sets which event types to save to EDF file
+            # Event types: LEFT, RIGHT, FIXATION, FIXUPDATE, SACCADE, BLINK, MESSAGE, BUTTON, INPUT
+            "file_event_filter = " + s.file_event_filter,
+            # link_event_filter: Sets which event types to send over link (same types as file_event_filter)
+            "link_event_filter = " + s.link_event_filter,
+            # link_sample_data: Controls what sample data is transferred over the link
+            # Data types: LEFT/RIGHT, GAZE, GAZERES, AREA, HREF, PUPIL, STATUS, INPUT, HMARKER/HTARGET
+            "link_sample_data = " + s.link_sample_data,
+            # file_sample_data: Sets the contents of sample data in the EDF file recording
+            # Data types: LEFT/RIGHT, GAZE, GAZERES, AREA, HREF, PUPIL, STATUS, INPUT, HMARKER/HTARGET
+            "file_sample_data = " + s.file_sample_data,
+            # sample_rate: Sampling rate of the eye tracker (in Hz). Can only be changed in offline
+            # and camera setup modes. Common values: 250, 500, 1000, 2000 Hz. Default: 1000 Hz
+            f"sample_rate = {s.sample_rate}",
+            # pupil_size_diameter: Sets the type of data used for pupil size
+            # Types: AREA (0), DIAMETER (1, 128*sqrt(area)), WIDTH (2, 180*width), HEIGHT (3, 180*height)
+            f"pupil_size_diameter = {s.pupil_size_mode}",
+            # calibration_corner_scaling / validation_corner_scaling: Scaling factor for distance
+            # of corner targets from display center. Default is 1.0, but can be 0.75 to 0.9 to
+            # pull in corners (to limit gaze excursion or to limit validation to useful part of display)
+            # NOTE: setting for calibration also sets validation
+            f"calibration_corner_scaling = {s.calibration_corner_scaling}",
+            f"validation_corner_scaling = {s.validation_corner_scaling}",
+            # calibration_area_proportion / validation_area_proportion: For auto generated
+            # calibration/validation point positions, sets the part of width/height of display
+            # to be bounded by targets. Each may have a single proportion or a horizontal
+            # followed by a vertical proportion. Default values: 0.88, 0.83
+            # NOTE: setting for calibration also sets validation
+            f"calibration_area_proportion = {s.calibration_area_proportion[0]} {s.calibration_area_proportion[1]}",
+            f"validation_area_proportion = {s.validation_area_proportion[0]} {s.validation_area_proportion[1]}",
+            # heuristic_filter: Sets level of filtering on link/analog output and file data
+            # <link level> <file level>: 0 or OFF (no filter), 1 or ON (moderate, 1 sample delay),
+            # 2 (extra filtering, 2 sample delay). Default file filter level is 2
+            f"heuristic_filter {s.heuristic_filter[0]} {s.heuristic_filter[1]}",
+            # use_ellipse_fitter: Controls pupil fitting algorithm
+            # YES for ellipse fitting, NO for centroid (CENTROID mode)
+            f"use_ellipse_fitter = {'NO' if 'CENTROID' in s.pupil_tracking_mode else 'YES'}",
+        ]
+        self._send_config_commands(commands)
 
     def set_pupil_only_mode(self) -> None:
         """Set tracker in pupil only mode (no corneal reflection).
@@ -1511,12 +1751,14 @@ class EyeLink:  # noqa: PLR0904
         - elcl_use_pcr_matching = OFF: Disables pupil-CR matching
         - corneal_mode = NO: Activates pupil-only tracking mode
         """
-        self.send_command("force_corneal_reflection = OFF")
-        self.send_command("allow_pupil_without_cr = ON")
-        self.send_command("elcl_hold_if_no_corneal = OFF")
-        self.send_command("elcl_search_if_no_corneal = OFF")
-        self.send_command("elcl_use_pcr_matching = OFF")
-        self.send_command("corneal_mode = NO")
+        self._send_config_commands((
+            "force_corneal_reflection = OFF",
+            "allow_pupil_without_cr = ON",
+            "elcl_hold_if_no_corneal = OFF",
+            "elcl_search_if_no_corneal = OFF",
+            "elcl_use_pcr_matching = OFF",
+            "corneal_mode = NO",
+        ))
 
     def _enable_raw_data(self, do_enable: bool = True) -> None:
         """Enable/disable raw pupil and CR in online sample data over link.
@@ -1525,15 +1767,17 @@ class EyeLink:  # noqa: PLR0904
             do_enable: True to enable, False to disable
 
         """
-        # Switch tracker to idle and give it time to complete mode switch
-        self.set_offline_mode()
-        time.sleep(0.050)
+        # Switch tracker to idle and give it time to complete mode switch.
+        # Skipped when already idle, e.g. when toggled during setup/teardown.
+        if not self._in_idle_mode():
+            self.set_offline_mode()
+            self._wait_for_mode(pylink.IN_IDLE_MODE, timeout=0.050)
         pylink.enablePCRSample(do_enable)
 
     @staticmethod
     def _enable_realtime_mode() -> None:
         """Enable EyeLink realtime mode."""
-        pylink.beginRealTimeMode(100)
+        pylink.beginRealTimeMode(_RT_MODE_PRIORITY)
 
     @staticmethod
     def _disable_realtime_mode() -> None:
@@ -1544,15 +1788,15 @@ class EyeLink:  # noqa: PLR0904
         """Draw text on eye-tracker screen.
 
         Args:
-            msg: Text to draw
+            msg: Text to draw (quoted automatically unless already quoted)
 
         """
-        # Figure out center
-        x = self.settings.screen_res[0] / 2
+        # Quote the message unless the caller already did
+        if not (len(msg) > 1 and msg[0] == msg[-1] == '"'):
+            msg = f'"{msg}"'
 
-        # Send message
-        txt = f'"{msg}"'
-        self.draw_text(txt, (x, 50))
+        # Draw horizontally centered
+        self.draw_text(msg, (self.settings.screen_res[0] * 0.5, 50))
 
     def _setup_raw_data_recording(self, enable: bool = True) -> None:
         """Configure tracker for raw pupil/CR data recording.
@@ -1563,43 +1807,10 @@ class EyeLink:  # noqa: PLR0904
         """
         # Setup the EDF-file such that it adds 'raw' data
         if enable:
-            # file_sample_raw_pcr: Enables raw PCR mode for file output, which outputs only
-            # unmodified full-resolution pupil and CR data. Data encoded using RAW (px,py,pa),
-            # HREF (hx,hy), and gaze(gx,gy,rx,ry) fields. Requires PUPIL, AREA, GAZE, GAZERES,
-            # HREF data types enabled. Default: OFF
-            self.send_command("file_sample_raw_pcr = 0")  # Don't write raw data to file...
-
-            # link_sample_raw_pcr: Enables raw PCR mode for link output (same encoding as file).
-            # Outputs unmodified full-resolution pupil and CR data over the link. Default: OFF
-            self.send_command("link_sample_raw_pcr = 1")  # only over link
-
-            # raw_pcr_dual_corneal: Enables detection of 2 corneal reflections in raw_pcr mode
-            # These CR's are the 2 candidates closest to the pupil center. Data encoded using
-            # HMARKER with htype code = 0xC0 + (word count). Default: OFF
-            # Enable dual corneal tracking only if requested (can add noise during calibration)
-            if self.settings.enable_dual_corneal_tracking:
-                self.send_command("raw_pcr_dual_corneal = 1")  # Enable tracking of two CR (corneal reflections)
-            else:
-                self.send_command("raw_pcr_dual_corneal = 0")  # Track only primary CR
-
-            self.send_command("inputword_is_window = ON")
-            self.send_command(
-                "file_sample_data = LEFT,RIGHT,GAZE,GAZERES,AREA,HREF,PUPIL,STATUS,INPUT,HMARKER,HTARGET"
-            )
-            self.send_command(
-                "link_sample_data = LEFT,RIGHT,GAZE,GAZERES,AREA,HREF,PUPIL,STATUS,INPUT,HMARKER,HTARGET"
-            )
+            commands = _RAW_PCR_ENABLE_COMMANDS[self.settings.enable_dual_corneal_tracking]
         else:
-            self.send_command("file_sample_raw_pcr = 0")
-            self.send_command("link_sample_raw_pcr = 0")
-            self.send_command("raw_pcr_dual_corneal = 0")
-
-            self.send_command(
-                "file_sample_data = LEFT,RIGHT,GAZE,GAZERES,AREA,HREF,PUPIL,STATUS,INPUT,HMARKER,HTARGET"
-            )
-            self.send_command(
-                "link_sample_data = LEFT,RIGHT,GAZE,GAZERES,AREA,HREF,PUPIL,STATUS,INPUT,HMARKER,HTARGET"
-            )
+            commands = _RAW_PCR_DISABLE_COMMANDS
+        self._send_config_commands(commands)
 
 
 __all__ = ["EyeLink", "Settings"]
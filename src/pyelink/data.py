@@ -20,6 +20,10 @@ from .utils import RingBuffer
 
 logger = logging.getLogger(__name__)
 
+# getNextData() item codes (pylink.SAMPLE_TYPE, and "nothing pending" results)
+_SAMPLE_TYPE = 200
+_NO_DATA_TYPES = frozenset({0x3F, 0})
+
 
 class DataBuffer:
     """Handles data retrieval and buffering from EyeLink tracker.
@@ -165,13 +169,13 @@ class DataBuffer:
             t0 = time.time()
             while (time.time() - t0) < timeout:
                 data_type = self.device.get_next_data()
-                if data_type == 200:  # Sample data
+                if data_type == _SAMPLE_TYPE:
                     sample = self.device.get_float_data()
                     if sample is not None:
                         t = sample.getTime()
                         sample_info = self._unpack_sample(t, sample, eye_used, write_to_edf)
                         break
-                elif data_type in {0x3F, 0}:  # No data available
+                elif data_type in _NO_DATA_TYPES:
                     break
                 else:
                     continue
@@ -293,7 +297,7 @@ class DataBuffer:
             t0 = time.time()
             while (time.time() - t0) < timeout:
                 data_type = self.device.get_next_data()
-                if data_type == 200:  # Sample data
+                if data_type == _SAMPLE_TYPE:
                     rawsample = self.device.get_float_data()
 
                     # if the timestamps between old and new samples differ, it's new
@@ -304,7 +308,7 @@ class DataBuffer:
                             self.t_old = t
                             break
 
-                elif data_type in {0x3F, 0}:  # No data available
+                elif data_type in _NO_DATA_TYPES:
                     break
                 else:
                     continue
@@ -434,7 +438,7 @@ class DataBuffer:
             else:
                 self.get_sample(write_to_edf=False)
 
-            if np.mod(k, 10) == 0:
+            if k % 10 == 0:
                 time.sleep(0.001)
             k += 1
 
@@ -474,7 +478,7 @@ class DataBuffer:
             else:
                 self.get_raw_sample(write_to_edf=True)
 
-            if np.mod(k, 10) == 0:
+            if k % 10 == 0:
                 time.sleep(0.001)
             k += 1
 
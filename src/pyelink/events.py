@@ -14,12 +14,15 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .core import EyeLink
 
-import numpy as np
-
 from .utils import RingBuffer
 
 logger = logging.getLogger(__name__)
 
+# getNextData() item codes (pylink.ENDBLINK, pylink.ENDFIX, and "nothing pending" results)
+_ENDBLINK = 4
+_ENDFIX = 8
+_NO_DATA_TYPES = frozenset({0x3F, 0})
+
 
 class EventProcessor:
     """Processes blink, fixation, and saccade events from EyeLink tracker.
@@ -85,12 +88,12 @@ class EventProcessor:
             t0 = time.time()
             while (time.time() - t0) < timeout:
                 data_type = self.device.get_next_data()
-                if data_type == 4:  # ENDBLINK event
+                if data_type == _ENDBLINK:
                     event_type = "blink"
                     blink_event = self.device.get_float_data()
                     if blink_event is not None:
                         event_prop.append(blink_event.getEndTime() - blink_event.getStartTime())
-                elif data_type == 8:  # ENDFIX (fixation end) event
+                elif data_type == _ENDFIX:
                     event_type = "fixation"
                     fix_event = self.device.get_float_data()
                     if fix_event is not None:
@@ -98,7 +101,7 @@ class EventProcessor:
                             fix_event.getEndTime() - fix_event.getStartTime(),
                             fix_event.getAveragePupilSize(),
                         ])
-                elif data_type in {0x3F, 0}:  # No data available
+                elif data_type in _NO_DATA_TYPES:
                     break
                 else:
                     continue
@@ -142,7 +145,7 @@ class EventProcessor:
                     self.fixdur_buf.append(event_prop[0])
                     self.pupsize_buf.append(event_prop[1])
 
-            if np.mod(k, 10) == 0:
+            if k % 10 == 0:
                 time.sleep(0.001)
             k += 1
 
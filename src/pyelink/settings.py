@@ -12,6 +12,12 @@ from typing import Callable, Literal
 
 from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
 
+# EDF filenames: letters, digits and underscores only (length is checked separately)
+_FILENAME_PATTERN = re.compile(r"^[a-zA-Z0-9_]+$")
+
+# Default for both file_event_filter and link_event_filter
+_DEFAULT_EVENT_FILTER = "LEFT,RIGHT,FIXATION,SACCADE,BLINK,MESSAGE,BUTTON,INPUT"
+
 
 class Settings(BaseModel):
     """EyeLink tracker configuration with runtime validation.
@@ -676,7 +682,7 @@ class Settings(BaseModel):
     # =========================================================================
 
     file_event_filter: str = Field(
-        default="LEFT,RIGHT,FIXATION,SACCADE,BLINK,MESSAGE,BUTTON,INPUT",
+        default=_DEFAULT_EVENT_FILTER,
         description="""Events to record to EDF file.
 
         Comma-separated list of event types.
@@ -688,7 +694,7 @@ class Settings(BaseModel):
     )
 
     link_event_filter: str = Field(
-        default="LEFT,RIGHT,FIXATION,SACCADE,BLINK,MESSAGE,BUTTON,INPUT",
+        default=_DEFAULT_EVENT_FILTER,
         description="""Events to send over ethernet link (real-time).
 
         Same format as file_event_filter.
@@ -953,7 +959,6 @@ class Settings(BaseModel):
         max_length = self.max_filename_length
 
         # Determine validation rules - only length changes, character rules stay the same
-        pattern = r"^[a-zA-Z0-9_]+$"
         limit = max_length if enable_long else 8
         mode_desc = f"{limit} characters" if enable_long else "8-character limit (DOS 8.3 format)"
 
@@ -967,7 +972,7 @@ class Settings(BaseModel):
             raise ValueError(f"Filename '{filename}' exceeds maximum length of {mode_desc}. {suggestion}")
 
         # Validate characters
-        if not re.match(pattern, filename):
+        if not _FILENAME_PATTERN.match(filename):
             raise ValueError(
                 f"Filename '{filename}' contains invalid characters. "
                 f"Only alphanumeric characters and underscores are allowed."
@@ -981,6 +986,19 @@ class Settings(BaseModel):
 
         return self
 
+    # =========================================================================
+    # DERIVED PROPERTIES
+    # =========================================================================
+
+    @property
+    def is_dummy_mode(self) -> bool:
+        """Whether the tracker should run in dummy mode (no hardware).
+
+        host_ip is validated against a pattern that only accepts an IPv4 address
+        or the exact string "dummy", so a plain comparison is sufficient.
+        """
+        return self.host_ip == "dummy"
+
     # =========================================================================
     # SERIALIZATION METHODS
     # =========================================================================
@@ -1019,8 +1037,13 @@ class Settings(BaseModel):
         Returns:
             Dictionary representation of all settings
 
+        Note:
+            All fields hold immutable values (scalars, strings, tuples) or a
+            callback, so a shallow field copy is equivalent to model_dump()
+            without its recursive serialization pass.
+
         """
-        return self.model_dump()
+        return dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> Settings: